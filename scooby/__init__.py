@@ -15,17 +15,24 @@ Werthmüller for ``empymod``, ``emg3d``, and the ``SimPEG`` framework
 ``watermark.py`` from https://github.com/rasbt/watermark.
 """
 
-from scooby.knowledge import (  # noqa
-    get_standard_lib_modules,
-    in_ipykernel,
-    in_ipython,
-    meets_version,
-    version_tuple,
-)
-from scooby.report import AutoReport, Report, get_version
-from scooby.tracker import TrackedReport, track_imports, untrack_imports
-
-doo = Report
+# Same as typing.TYPE_CHECKING, without importing typing at runtime
+TYPE_CHECKING = False
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import Any, List
+
+    from scooby.knowledge import (  # noqa
+        get_standard_lib_modules,
+        in_ipykernel,
+        in_ipython,
+        meets_version,
+        version_tuple,
+    )
+    from scooby.report import AutoReport, Report, get_version
+    from scooby.tracker import TrackedReport, track_imports, untrack_imports
+
+    doo = Report
+
+del TYPE_CHECKING
 
 __all__ = [
     'AutoReport',
@@ -40,6 +47,46 @@ __all__ = [
     'untrack_imports',
 ]
 
+# Public names and the submodule they live in; the submodules are only
+# imported on first access, which keeps `import scooby` cheap (PEP 562)
+_LAZY_ATTRIBUTES = {
+    'get_standard_lib_modules': 'knowledge',
+    'in_ipykernel': 'knowledge',
+    'in_ipython': 'knowledge',
+    'meets_version': 'knowledge',
+    'version_tuple': 'knowledge',
+    'AutoReport': 'report',
+    'Report': 'report',
+    'get_version': 'report',
+    'doo': 'report',
+    'TrackedReport': 'tracker',
+    'track_imports': 'tracker',
+    'untrack_imports': 'tracker',
+}
+
+# Submodules that are reachable as attributes after a plain `import scooby`
+_LAZY_SUBMODULES = ('knowledge', 'report', 'tracker')
+
+
+def __getattr__(name: str) -> 'Any':
+    """Import public names and submodules on first access."""
+    from importlib import import_module
+
+    if name in _LAZY_SUBMODULES:
+        return import_module(f'scooby.{name}')
+    try:
+        module = import_module(f'scooby.{_LAZY_ATTRIBUTES[name]}')
+    except KeyError:
+        raise AttributeError(f"module 'scooby' has no attribute '{name}'") from None
+    value = module.Report if name == 'doo' else getattr(module, name)
+    globals()[name] = value  # Cache, so __getattr__ is not called again
+    return value
+
+
+def __dir__() -> 'List[str]':
+    """List the module attributes, including the not yet imported ones."""
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | set(_LAZY_SUBMODULES))
+
 
 __author__ = 'Dieter Werthmüller, Bane Sullivan, Alex Kaszynski, and contributors'
 __license__ = 'MIT'
@@ -2,12 +2,10 @@
 
 import argparse
 import importlib
-from importlib.metadata import PackageNotFoundError
 import sys
 from typing import Any, Dict, List, Optional
 
 import scooby
-from scooby.report import Report, get_distribution_dependencies
 
 
 def main(args: Optional[List[str]] = None):
@@ -61,6 +59,8 @@ def act(args_dict: Dict[str, Any]) -> None:
         print(f"scooby v{scooby.__version__}")
         return
 
+    from scooby.report import Report, get_distribution_dependencies  # lazy-load see PR#85
+
     report = args_dict.pop('report')
     no_opt = args_dict.pop('no_opt')
     packages = args_dict.pop('packages')
@@ -73,6 +73,8 @@ def act(args_dict: Dict[str, Any]) -> None:
 
     # Report of another package.
     if report:
+        from importlib.metadata import PackageNotFoundError  # lazy-load see PR#85
+
         try:
             module = importlib.import_module(report)
         except ImportError:
@@ -9,10 +9,10 @@ particular modules (``VERSION_ATTRIBUTES``, ``VERSION_METHODS``)
 
 """
 
+from functools import lru_cache
 import os
 import sys
-import sysconfig
-from typing import Callable, Dict, List, Literal, Set, Tuple, Union
+from typing import Callable, Dict, Literal, Set, Tuple, Union
 
 PACKAGE_ALIASES = {
     'vtkmodules': 'vtk',
@@ -72,6 +72,10 @@ def in_ipykernel() -> bool:
     -------
     bool : True if using an ipykernel
     """
+    # A kernel shell cannot exist without ipykernel being imported
+    if 'ipykernel' not in sys.modules:
+        return False
+
     ipykernel = False
     if in_ipython():
         try:
@@ -83,6 +87,8 @@ def in_ipykernel() -> bool:
 
 def get_standard_lib_modules() -> Set[str]:
     """Return a set of the names of all modules in the standard library."""
+    import sysconfig  # lazy-load see PR#85
+
     site_path = sysconfig.get_path('stdlib')
     if getattr(sys, 'frozen', False):  # within pyinstaller
         lib_path = os.path.join(site_path, '..')
@@ -120,6 +126,7 @@ def get_standard_lib_modules() -> Set[str]:
     return stdlib_pkgs
 
 
+@lru_cache(maxsize=128)
 def version_tuple(v: str) -> Tuple[int, ...]:
     """Convert a version string to a tuple containing ints.
 
@@ -139,14 +146,7 @@ def version_tuple(v: str) -> Tuple[int, ...]:
     if len(split_v) > 3:
         raise ValueError('Version strings containing more than three parts ' 'cannot be parsed')
 
-    vals: List[int] = []
-    for item in split_v:
-        if item.isnumeric():
-            vals.append(int(item))
-        else:
-            vals.append(0)
-
-    return tuple(vals)
+    return tuple(int(item) if item.isnumeric() else 0 for item in split_v)
 
 
 def meets_version(version: str, meets: str) -> bool:
@@ -178,20 +178,8 @@ def meets_version(version: str, meets: str) -> bool:
     >>> meets_version('0.26.0', '0.25.2')
     True
     """
-    va = version_tuple(version)
-    vb = version_tuple(meets)
-
-    if len(va) != len(vb):
-        raise AssertionError("Versions are not comparable.")
-
-    for i in range(len(va)):
-        if va[i] > vb[i]:
-            return True
-        elif va[i] < vb[i]:
-            return False
-
-    # Arrived here if same version
-    return True
+    # Both tuples have length 3, so they compare element-wise
+    return version_tuple(version) >= version_tuple(meets)
 
 
 def get_filesystem_type() -> Union[str, Literal[False]]:
@@ -201,11 +189,10 @@ def get_filesystem_type() -> Union[str, Literal[False]]:
     except ImportError:
         psutil = False
     from pathlib import Path  # lazy-load see PR#85
-    import platform  # lazy-load see PR#85
 
     # Skip Windows due to https://github.com/banesullivan/scooby/issues/75
     fs_type: Union[str, Literal[False]]
-    if psutil and platform.system() != 'Windows':
+    if psutil and sys.platform != 'win32':
         # Code by https://stackoverflow.com/a/35291824/10504481
         my_path = str(Path(__file__).resolve())
         best_match = ""
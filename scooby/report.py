@@ -1,11 +1,12 @@
 """The main module containing the `Report` class."""
 
-import importlib
-from importlib.metadata import PackageNotFoundError, distribution, version as importlib_version
+from functools import cached_property, lru_cache
+from operator import attrgetter
+import os
+import re
 import sys
-import time
 from types import ModuleType
-from typing import Any, Dict, List, Literal, Optional, Tuple, Union, cast
+from typing import Any, Dict, Iterable, List, Literal, Optional, Tuple, Union, cast
 
 from .knowledge import (
     PACKAGE_ALIASES,
@@ -20,6 +21,65 @@ MODULE_NOT_FOUND = 'Module not found'
 MODULE_TROUBLE = 'Trouble importing'
 VERSION_NOT_FOUND = 'Version unknown'
 
+# Project name at the start of a Requires-Dist entry such as "name[extra]>=1.0; marker"
+_REQ_NAME = re.compile(r'^\s*([A-Za-z0-9_.-]+)')
+
+# Sentinel for attributes that are not present
+_MISSING = object()
+
+# platform.system() names of common sys.platform values
+_SYSTEMS = {'linux': 'Linux', 'darwin': 'Darwin', 'win32': 'Windows'}
+
+# Styles of the HTML table cells
+_HTML_BORDER = "border: 1px solid;'"
+_TD_LEFT = "    <td style='text-align: left; " + _HTML_BORDER + ">"
+_TD_RIGHT = "    <td style='text-align: right; " + _HTML_BORDER + ">"
+_TD_EMPTY = "    <td style= " + _HTML_BORDER + "></td>\n"
+_TD_EMPTY_PAIR = _TD_EMPTY + _TD_EMPTY
+_TR_OPEN = "  <tr>\n"
+_TR_CLOSE = "  </tr>\n"
+_TR_BREAK = _TR_CLOSE + _TR_OPEN
+
+# Skeleton of the HTML report; the rows are filled in by Report._repr_html_
+_HTML_TABLE = (
+    "<table style='border: 1.5px solid;{max_width}'>\n"
+    "{date}{platform}{python}{packages}{mkl}"
+    "</table>"
+)
+
+
+def _html_colspan(txt: str, ncol: int, nrow: int) -> str:
+    """Return ``txt`` as an HTML row spanning the whole table."""
+    align = "left" if ncol == 1 else "center"
+    font = "font-weight: bold; font-size: 1.2em; " if nrow == 0 else ""
+    return (
+        f"  <tr>\n     <td style='text-align: {align}; {font}{_HTML_BORDER} "
+        f"colspan='{2 * ncol}'>{txt}</td>\n  </tr>\n"
+    )
+
+
+def _html_cols(items: List[Tuple[str, Any]], ncol: int, pad: bool) -> str:
+    """Return (name, version) pairs as HTML rows of ``ncol`` cell pairs."""
+    # Names are right-aligned against their versions, unless there is a single column
+    td_name = _TD_LEFT if ncol == 1 else _TD_RIGHT
+    cells = [f"{td_name}{name}</td>\n{_TD_LEFT}{version}</td>\n" for name, version in items]
+    # Fill up the last row
+    if pad:
+        cells += [_TD_EMPTY_PAIR] * (-len(cells) % ncol)
+    rows = ("".join(cells[i : i + ncol]) for i in range(0, len(cells), ncol))
+    return _TR_OPEN + _TR_BREAK.join(rows) + _TR_CLOSE
+
+
+@lru_cache(maxsize=16)
+def _wrap(text: str, width: int) -> Tuple[str, ...]:
+    """Wrap ``text`` to ``width``, skipping textwrap if it already fits on one line."""
+    if 0 < len(text) <= width and text.isprintable() and not text[-1].isspace():
+        return (text,)
+
+    import textwrap  # lazy-load see PR#85
+
+    return tuple(textwrap.wrap(text, width))
+
 
 # Info classes
 class PlatformInfo:
@@ -27,17 +87,18 @@ class PlatformInfo:
 
     def __init__(self):
         """Initialize."""
-        self._mkl_info: Optional[str]  # for typing purpose
-        self._filesystem: Union[str, Literal[False]]
+        import time  # lazy-load see PR#85
 
-    @property
+        self._date = time.strftime('%a %b %d %H:%M:%S %Y %Z')
+
+    @cached_property
     def system(self) -> str:
         """Return the system/OS name.
 
         E.g. ``'Linux (name version)'``, ``'Windows'``, or ``'Darwin'``. An empty string is
         returned if the value cannot be determined.
         """
-        s = platform().system()
+        s = _SYSTEMS.get(sys.platform) or platform().system()
         if s == 'Linux':
             try:
                 s += (
@@ -66,7 +127,7 @@ class PlatformInfo:
     @property
     def platform(self) -> str:
         """Return the platform."""
-        return platform().platform()
+        return _platform_value('platform')
 
     @property
     def machine(self) -> str:
@@ -74,80 +135,61 @@ class PlatformInfo:
 
         An empty string is returned if the value cannot be determined.
         """
-        return platform().machine()
+        return _platform_value('machine')
 
     @property
     def architecture(self) -> str:
         """Return the bit architecture used for the executable."""
-        return platform().architecture()[0]
+        return _platform_value('architecture')[0]
 
-    @property
+    @cached_property
     def cpu_count(self) -> int:
         """Return the number of CPUs in the system."""
-        if not hasattr(self, '_cpu_count'):
-            import multiprocessing  # lazy-load see PR#85
-
-            self._cpu_count = multiprocessing.cpu_count()
-        return self._cpu_count
+        return os.cpu_count() or 1
 
-    @property
+    @cached_property
     def total_ram(self) -> str:
         """Return total RAM info.
 
         If not available, returns 'unknown'.
         """
-        if not hasattr(self, '_total_ram'):
-            try:
-                import psutil  # lazy-load see PR#85
-
-                tmem = psutil.virtual_memory().total
-                self._total_ram = '{:.1f} GiB'.format(tmem / (1024.0**3))
-            except ImportError:
-                self._total_ram = 'unknown'
+        try:
+            import psutil  # lazy-load see PR#85
+        except ImportError:
+            return 'unknown'
 
-        return self._total_ram
+        tmem = psutil.virtual_memory().total
+        return '{:.1f} GiB'.format(tmem / (1024.0**3))
 
-    @property
+    @cached_property
     def mkl_info(self) -> Optional[str]:
         """Return MKL info.
 
         If not available, returns 'unknown'.
         """
-        if not hasattr(self, '_mkl_info'):
-            try:
-                import mkl  # lazy-load see PR#85
-
-                mkl.get_version_string()
-            except (ImportError, AttributeError):
-                mkl = False
-
-            try:
-                import numexpr  # lazy-load see PR#85
-
-            except ImportError:
-                numexpr = False
+        # Get mkl info from mkl or, only if that fails, from numexpr
+        try:
+            import mkl  # lazy-load see PR#85
 
-            # Get mkl info from numexpr or mkl, if available
-            if mkl:
-                self._mkl_info = cast(str, mkl.get_version_string())
-            elif numexpr:
-                self._mkl_info = cast(str, numexpr.get_vml_version())
-            else:
-                self._mkl_info = None
+            return cast(str, mkl.get_version_string())
+        except (ImportError, AttributeError):
+            pass
 
-        return self._mkl_info
+        try:
+            import numexpr  # lazy-load see PR#85
+        except ImportError:
+            return None
+        return cast(str, numexpr.get_vml_version())
 
     @property
     def date(self) -> str:
-        """Return the date formatted as a string."""
-        return time.strftime('%a %b %d %H:%M:%S %Y %Z')
+        """Return the date of the report formatted as a string."""
+        return self._date
 
-    @property
+    @cached_property
     def filesystem(self) -> Union[str, Literal[False]]:
         """Get the type of the file system at the path of the scooby package."""
-        if not hasattr(self, '_filesystem'):
-            self._filesystem = get_filesystem_type()
-        return self._filesystem
+        return get_filesystem_type()
 
 
 class PythonInfo:
@@ -169,19 +211,21 @@ class PythonInfo:
         self._add_packages(core)  # Provided by a module dev
         self._add_packages(optional, optional=True)  # Optional packages
 
+        # Sort once here rather than on every access of `packages`
+        if sort:
+            self._packages = dict(sorted(self._packages.items(), key=lambda item: item[0].lower()))
+
     def _add_packages(
         self, packages: Optional[List[Union[str, ModuleType]]], optional: bool = False
     ):
         """Add all packages to list; optional ones only if available."""
-        # Ensure arguments are a list
+        # Ensure arguments are iterable; lists and tuples are used as they are
         if isinstance(packages, (str, ModuleType)):
-            pckgs: List[Union[str, ModuleType]] = [
-                packages,
-            ]
-        elif packages is None or len(packages) < 1:
-            pckgs = list()
+            pckgs: Iterable[Union[str, ModuleType]] = (packages,)
+        elif packages is None or len(packages) == 0:
+            return
         else:
-            pckgs = list(packages)
+            pckgs = packages
 
         # Loop over packages
         for pckg in pckgs:
@@ -194,9 +238,12 @@ class PythonInfo:
         """Return the system version."""
         return sys.version
 
-    @property
+    @cached_property
     def python_environment(self) -> Literal['Jupyter', 'IPython', 'Python']:
         """Return the python environment."""
+        # IPython cannot be running if it has not been imported
+        if 'IPython' not in sys.modules:
+            return 'Python'
         if in_ipykernel():
             return 'Jupyter'
         elif in_ipython():
@@ -210,13 +257,7 @@ class PythonInfo:
         Includes available and unavailable/unknown.
 
         """
-        pckg_dict = dict(self._packages)
-        if self._sort:
-            packages: Dict[str, Any] = {}
-            for name in sorted(pckg_dict.keys(), key=lambda x: x.lower()):
-                packages[name] = pckg_dict[name]
-            pckg_dict = packages
-        return pckg_dict
+        return dict(self._packages)
 
 
 # The main Report instance
@@ -273,6 +314,7 @@ class Report(PlatformInfo, PythonInfo):
         if optional is None:
             optional = ['numpy', 'scipy', 'IPython', 'matplotlib', 'scooby']
 
+        PlatformInfo.__init__(self)
         PythonInfo.__init__(self, additional=additional, core=core, optional=optional, sort=sort)
         self.ncol = int(ncol)
         self.text_width = int(text_width)
@@ -292,137 +334,71 @@ class Report(PlatformInfo, PythonInfo):
 
     def __repr__(self) -> str:
         """Return Plain-text version information."""
-        import textwrap  # lazy-load see PR#85
-
         # Width for text-version
-        text = '\n' + self.text_width * '-' + '\n'
+        text = ['\n', self.text_width * '-', '\n']
 
         # Date and time info as title
         date_text = '  Date: '
-        mult = 0
         indent = len(date_text)
-        for txt in textwrap.wrap(self.date, self.text_width - indent):
-            date_text += ' ' * mult + txt + '\n'
-            mult = indent
-        text += date_text + '\n'
+        for txt in _wrap(self.date, self.text_width - indent):
+            text.append(date_text + txt + '\n')
+            date_text = ' ' * indent
+        text.append('\n')
 
         # Get length of longest package: min of 18 and max of 40
-        if self._packages:
-            row_width = min(40, max(18, len(max(self._packages.keys(), key=len))))
+        packages = self.packages
+        if packages:
+            row_width = min(40, max(18, len(max(packages.keys(), key=len))))
         else:
             row_width = 18
+        line = f'{{:>{row_width}}} : {{}}\n'.format
 
         # Platform/OS details
         repr_dict = self.to_dict()
         for key in ['OS', 'CPU(s)', 'Machine', 'Architecture', 'RAM', 'Environment', 'File system']:
             if key in repr_dict:
-                text += f'{key:>{row_width}} : {repr_dict[key]}\n'
+                text.append(line(key, repr_dict[key]))
         for key, value in self._extra_meta:
-            text += f'{key:>{row_width}} : {value}\n'
+            text.append(line(key, value))
 
         # Python details
-        text += '\n'
-        for txt in textwrap.wrap('Python ' + self.sys_version, self.text_width - 4):
-            text += '  ' + txt + '\n'
-        if self._packages:
-            text += '\n'
+        text.append('\n')
+        for txt in _wrap('Python ' + self.sys_version, self.text_width - 4):
+            text.append('  ' + txt + '\n')
+        if packages:
+            text.append('\n')
 
         # Loop over packages
-        for name, version in self._packages.items():
-            text += f'{name:>{row_width}} : {version}\n'
+        for name, version in packages.items():
+            text.append(line(name, version))
 
         # MKL details
         if self.mkl_info:
-            text += '\n'
-            for txt in textwrap.wrap(self.mkl_info, self.text_width - 4):
-                text += '  ' + txt + '\n'
+            text.append('\n')
+            for txt in _wrap(self.mkl_info, self.text_width - 4):
+                text.append('  ' + txt + '\n')
 
         # Finish
-        text += self.text_width * '-'
+        text.append(self.text_width * '-')
 
-        return text
+        return ''.join(text)
 
     def _repr_html_(self) -> str:
         """Return HTML-rendered version information."""
-        # Define html-styles
-        border = "border: 1px solid;'"
-
-        def colspan(html: str, txt: str, ncol: int, nrow: int) -> str:
-            r"""Print txt in a row spanning whole table."""
-            html += "  <tr>\n"
-            html += "     <td style='"
-            if ncol == 1:
-                html += "text-align: left; "
-            else:
-                html += "text-align: center; "
-            if nrow == 0:
-                html += "font-weight: bold; font-size: 1.2em; "
-            html += border + " colspan='"
-            html += f"{2 * ncol}'>{txt}</td>\n"
-            html += "  </tr>\n"
-            return html
-
-        def cols(html: str, version: str, name: str, ncol: int, i: int) -> Tuple[str, int]:
-            r"""Print package information in two cells."""
-            # Check if we have to start a new row
-            if i > 0 and i % ncol == 0:
-                html += "  </tr>\n"
-                html += "  <tr>\n"
-
-            align = "left" if ncol == 1 else "right"
-            html += f"    <td style='text-align: {align};"
-            html += " " + border + ">%s</td>\n" % name
-
-            html += "    <td style='text-align: left; "
-            html += border + ">%s</td>\n" % version
-
-            return html, i + 1
-
-        # Start html-table
-        html = "<table style='border: 1.5px solid;"
-        if self.max_width:
-            html += f" max-width: {self.max_width}px;"
-        html += "'>\n"
-
-        # Date and time info as title
-        html = colspan(html, self.date, self.ncol, 0)
-
         # Platform/OS details
-        html += "  <tr>\n"
         repr_dict = self.to_dict()
-        i = 0
-        for key in ['OS', 'CPU(s)', 'Machine', 'Architecture', 'RAM', 'Environment', "File system"]:
-            if key in repr_dict:
-                html, i = cols(html, repr_dict[key], key, self.ncol, i)
-        for meta in self._extra_meta:
-            html, i = cols(html, meta[1], meta[0], self.ncol, i)
-        # Finish row
-        html += "  </tr>\n"
-
-        # Python details
-        html = colspan(html, 'Python ' + self.sys_version, self.ncol, 1)
-        html += "  <tr>\n"
-
-        # Loop over packages
-        i = 0  # Reset count for rows.
-        for name, version in self.packages.items():
-            html, i = cols(html, version, name, self.ncol, i)
-        # Fill up the row
-        while i % self.ncol != 0:
-            html += "    <td style= " + border + "></td>\n"
-            html += "    <td style= " + border + "></td>\n"
-            i += 1
-        # Finish row
-        html += "  </tr>\n"
-
-        # MKL details
-        if self.mkl_info:
-            html = colspan(html, self.mkl_info, self.ncol, 2)
-
-        # Finish
-        html += "</table>"
-
-        return html
+        keys = ['OS', 'CPU(s)', 'Machine', 'Architecture', 'RAM', 'Environment', "File system"]
+        items = [(key, repr_dict[key]) for key in keys if key in repr_dict]
+        items += [(meta[0], meta[1]) for meta in self._extra_meta]
+
+        return _HTML_TABLE.format(
+            max_width=f" max-width: {self.max_width}px;" if self.max_width else "",
+            date=_html_colspan(self.date, self.ncol, 0),
+            platform=_html_cols(items, self.ncol, pad=False),
+            python=_html_colspan('Python ' + self.sys_version, self.ncol, 1),
+            packages=_html_cols(list(self.packages.items()), self.ncol, pad=True),
+            mkl=_html_colspan(self.mkl_info, self.ncol, 2) if self.mkl_info else "",
+        )
 
     def to_dict(self) -> Dict[str, str]:
         """Return report as dict for storage."""
@@ -448,8 +424,7 @@ class Report(PlatformInfo, PythonInfo):
         out['Python'] = self.sys_version
 
         # Loop over packages
-        for name, version in self._packages.items():
-            out[name] = version
+        out.update(self.packages)
 
         # MKL details
         if self.mkl_info:
@@ -503,59 +478,73 @@ def get_version(module: Union[str, ModuleType]) -> Tuple[str, Optional[str]]:
     version : str or None
         Version of module.
     """
-    # module is (1) a module or (2) a string.
-    if not isinstance(module, (str, ModuleType)):
-        raise TypeError("Cannot fetch version from type " "({})".format(type(module)))
-
-    # module is module; get name
-    if isinstance(module, ModuleType):
-        name = module.__name__
-    else:
+    # module is (1) a string or (2) a module; get name
+    if isinstance(module, str):
         name = module
         module = None
+    elif isinstance(module, ModuleType):
+        name = module.__name__
+    else:
+        raise TypeError("Cannot fetch version from type " "({})".format(type(module)))
 
     # Check aliased names
     if name in PACKAGE_ALIASES:
         name = PACKAGE_ALIASES[name]
 
+    return name, _get_version(name, module)
+
+
+def _get_version(name: str, module: Optional[ModuleType]) -> Optional[str]:
+    """Return the version of the (aliased) package ``name``; see ``get_version``."""
     # try importlib.metadata before loading the module
+    from importlib.metadata import (  # lazy-load see PR#85
+        PackageNotFoundError,
+        version as importlib_version,
+    )
+
     try:
-        return name, importlib_version(name)
+        return importlib_version(name)
     except PackageNotFoundError:
         module = None
 
-    # importlib could not find the package, try to load it
+    # importlib could not find the package, try to load it; modules that are
+    # already loaded are taken from sys.modules without the import machinery
     if module is None:
+        module = sys.modules.get(name)
+    if module is None:
+        import importlib  # lazy-load see PR#85
+
         try:
             module = importlib.import_module(name)
         except ImportError:
-            return name, MODULE_NOT_FOUND
+            return MODULE_NOT_FOUND
         except Exception:
-            return name, MODULE_TROUBLE
+            return MODULE_TROUBLE
 
     # Try common version names on loaded module
     for v_string in ('__version__', 'version'):
+        version = getattr(module, v_string, _MISSING)
+        if version is not _MISSING:
+            return version
+
+    # Try the VERSION_ATTRIBUTES library; attributes may be dotted paths
+    attr = VERSION_ATTRIBUTES.get(name)
+    if attr is not None:
         try:
-            return name, getattr(module, v_string)
+            return attrgetter(attr)(module)
         except AttributeError:
             pass
 
-    # Try the VERSION_ATTRIBUTES library
-    try:
-        attr = VERSION_ATTRIBUTES[name]
-        return name, getattr(module, attr)
-    except (KeyError, AttributeError):
-        pass
-
     # Try the VERSION_METHODS library
-    try:
-        method = VERSION_METHODS[name]
-        return name, method()
-    except (KeyError, ImportError):
-        pass
+    method = VERSION_METHODS.get(name)
+    if method is not None:
+        try:
+            return method()
+        except ImportError:
+            pass
 
     # If still not found, return VERSION_NOT_FOUND
-    return name, VERSION_NOT_FOUND
+    return VERSION_NOT_FOUND
 
 
 def platform() -> ModuleType:
@@ -565,6 +554,12 @@ def platform() -> ModuleType:
     return platform
 
 
+@lru_cache(maxsize=None)
+def _platform_value(name: str) -> Any:
+    """Return ``platform.<name>()``, computed once per process."""
+    return getattr(platform(), name)()
+
+
 def get_distribution_dependencies(dist_name: str):
     """Get the dependencies of a specified package distribution.
 
@@ -578,8 +573,11 @@ def get_distribution_dependencies(dist_name: str):
     dependencies : list
         List of dependency names.
     """
+    from importlib.metadata import PackageNotFoundError, distribution  # lazy-load see PR#85
+
     try:
         dist = distribution(dist_name)
     except PackageNotFoundError:
         raise PackageNotFoundError(f"Package `{dist_name}` has no distribution.")
-    return [pkg.split()[0] for pkg in dist.requires]
+    names = (_REQ_NAME.match(req).group(1) for req in dist.requires or ())
+    return list(dict.fromkeys(names))
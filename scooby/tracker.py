@@ -1,7 +1,7 @@
 """Track imports."""
 
 from types import ModuleType
-from typing import List, Mapping, Optional, Sequence, Set, Union
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Set, Union
 
 from scooby.knowledge import get_standard_lib_modules
 from scooby.report import Report
@@ -18,8 +18,8 @@ try:
 except (ImportError, AttributeError):
     pass
 
-# The variable we track all imports in
-TRACKED_IMPORTS: List[Union[str, ModuleType]] = ["scooby"]
+# The variable we track all imports in; a dict is used as an ordered set
+TRACKED_IMPORTS: Dict[str, None] = {"scooby": None}
 
 MODULES_TO_IGNORE = {
     "pyMKL",
@@ -31,16 +31,9 @@ MODULES_TO_IGNORE = {
 
 STDLIB_PKGS: Optional[Set[str]] = None
 
-
-def _criterion(name: str):
-    if (
-        len(name) > 0
-        and name not in STDLIB_PKGS
-        and not name.startswith("_")
-        and name not in MODULES_TO_IGNORE
-    ):
-        return True
-    return False
+# Copy of STDLIB_PKGS, filled in place by track_imports() so that the set
+# bound as a default of scooby_import stays current
+_STDLIB_NAMES: Set[str] = set()
 
 
 if TRACKING_SUPPORTED:
@@ -51,12 +44,24 @@ if TRACKING_SUPPORTED:
         locals: Optional[Mapping[str, object]] = None,
         fromlist: Sequence[str] = (),
         level: int = 0,
+        *,
+        _import: Callable[..., ModuleType] = CLASSIC_IMPORT,
+        _tracked: Dict[str, None] = TRACKED_IMPORTS,
+        _stdlib: Set[str] = _STDLIB_NAMES,
+        _ignore: Set[str] = MODULES_TO_IGNORE,
     ) -> ModuleType:
         """Override of the import method to track package names."""
-        m = CLASSIC_IMPORT(name, globals=globals, locals=locals, fromlist=fromlist, level=level)
-        name = name.split(".")[0]
-        if level == 0 and _criterion(name):
-            TRACKED_IMPORTS.append(name)
+        # Globals are bound as keyword-only defaults to make them fast locals;
+        # names added to MODULES_TO_IGNORE in place are seen, rebinding it is not
+        m = _import(name, globals=globals, locals=locals, fromlist=fromlist, level=level)
+        # Relative imports are within a package that is tracked already
+        if level != 0:
+            return m
+        name = name.partition(".")[0]
+        if name in _tracked:
+            return m
+        if name and name[0] != "_" and name not in _stdlib and name not in _ignore:
+            _tracked[name] = None
         return m
 
 
@@ -66,6 +71,8 @@ def track_imports() -> None:
         raise RuntimeError(SUPPORT_MESSAGE)
     global STDLIB_PKGS
     STDLIB_PKGS = get_standard_lib_modules()
+    _STDLIB_NAMES.clear()
+    _STDLIB_NAMES.update(STDLIB_PKGS)
     builtins.__import__ = scooby_import
     return
 
@@ -79,7 +86,7 @@ def untrack_imports() -> None:
         raise RuntimeError(SUPPORT_MESSAGE)
     builtins.__import__ = CLASSIC_IMPORT
     TRACKED_IMPORTS.clear()
-    TRACKED_IMPORTS.append("scooby")
+    TRACKED_IMPORTS["scooby"] = None
     return
 
 
@@ -110,7 +117,7 @@ class TrackedReport(Report):
         Report.__init__(
             self,
             additional=additional,
-            core=TRACKED_IMPORTS,
+            core=list(TRACKED_IMPORTS),
             ncol=ncol,
             text_width=text_width,
             sort=sort,
@@ -2,24 +2,35 @@ import os
 import re
 import subprocess
 import sys
+import time
+from types import ModuleType, SimpleNamespace
 
-from bs4 import BeautifulSoup
-import numpy
 import pytest
 
 import scooby
 
-# Write a package `dummy_module` without version number.
-ppath = os.path.join("tests", "dummy_module")
-try:
-    os.mkdir(ppath)
-except FileExistsError:
-    pass
+# Markup and words of the reports, used to compare the HTML and plain text
+_HTML_TAG_RE = re.compile(r"<[^>]*>")
+_WORD_RE = re.compile(r"[a-zA-Z1-9]+")
 
-with open(os.path.join(ppath, "__init__.py"), "w") as f:
-    f.write("info = 'Package without __version__ number.'\n")
+# Part of a text report from the OS row up to the scooby row or the final line
+_REPORT_BODY_RE = re.compile(r"OS :(.*?)(?:scooby :|--------)", re.DOTALL)
 
-sys.path.append('tests')
+# Output line of `python -X importtime`
+_IMPORT_TIME_RE = re.compile(r"^import time:\s*(\d+) \|\s*(\d+) \|(.*)$", re.MULTILINE)
+
+
+@pytest.fixture(scope='session', autouse=True)
+def dummy_module(tmp_path_factory):
+    # Write a package `dummy_module` without version number.
+    root = tmp_path_factory.mktemp('packages')
+    (root / 'dummy_module').mkdir()
+    (root / 'dummy_module' / '__init__.py').write_text(
+        "info = 'Package without __version__ number.'\n"
+    )
+    sys.path.append(str(root))
+    yield
+    sys.path.remove(str(root))
 
 
 def test_report():
@@ -47,9 +58,28 @@ def test_report():
         ]
     )
     report = scooby.Report(additional=pytest)
+    import numpy
+
+    report = scooby.Report(additional=numpy.array(['numpy', 'pytest']))
+    assert list(report.packages)[:2] == ['numpy', 'pytest']
     report = scooby.Report(additional=['collections', 'foo', 'aaa'], sort=True)
 
 
+@pytest.mark.parametrize('text', ['', ' ', 'short', '  indented', 'trailing  ', 'a\tb', 'x' * 30])
+def test_wrap(text):
+    import textwrap
+
+    assert scooby.report._wrap(text, 20) == tuple(textwrap.wrap(text, 20))
+
+
+def test_sort():
+    report = scooby.Report(['pytest', 'collections', 'Aaa'], optional=[], sort=True)
+    assert list(report.packages) == ['Aaa', 'collections', 'pytest']
+    assert list(report.to_dict())[-3:] == ['Aaa', 'collections', 'pytest']
+    text = report.__repr__()
+    assert text.index('Aaa :') < text.index('collections :') < text.index('pytest :')
+
+
 def test_dict():
     report = scooby.Report(['no_version', 'does_not_exist'])
     for key, value in report.to_dict().items():
@@ -58,6 +88,14 @@ def test_dict():
         assert value[:10] in report.__repr__()
 
 
+def test_date_is_snapshot(monkeypatch):
+    report = scooby.Report(optional=[])
+    date = report.date
+    monkeypatch.setattr(time, 'strftime', lambda *args: 'later')
+    assert report.date == date
+    assert report.to_dict()['Date'] == date
+
+
 def test_inheritence_example():
     class Report(scooby.Report):
         def __init__(self, additional=None, ncol=3, text_width=80, sort=False):
@@ -95,6 +133,8 @@ def test_ipy():
 
 
 def test_get_version():
+    import numpy
+
     name, version = scooby.get_version(numpy)
     assert version == numpy.__version__
     assert name == "numpy"
@@ -114,13 +154,31 @@ def test_get_version():
     assert name == "does_not_exist"
 
 
+def test_get_version_attribute(monkeypatch):
+    module = ModuleType('dotted_version')
+    module.Qt = SimpleNamespace(VERSION_STR='1.2.3')
+    monkeypatch.setitem(sys.modules, 'dotted_version', module)
+    monkeypatch.setitem(scooby.report.VERSION_ATTRIBUTES, 'dotted_version', 'Qt.VERSION_STR')
+    assert scooby.get_version(module) == ('dotted_version', '1.2.3')
+
+
+def test_get_version_not_cached(monkeypatch):
+    # Knowledge added after a first lookup is used by later lookups
+    module = ModuleType('late_version')
+    monkeypatch.setitem(sys.modules, 'late_version', module)
+    assert scooby.get_version('late_version')[1] == scooby.report.VERSION_NOT_FOUND
+    module.VERSION = '4.5.6'
+    monkeypatch.setitem(scooby.knowledge.VERSION_ATTRIBUTES, 'late_version', 'VERSION')
+    assert scooby.get_version('late_version')[1] == '4.5.6'
+
+
 def test_plain_vs_html():
     report = scooby.Report()
-    text_html = BeautifulSoup(report._repr_html_(), features="html.parser").get_text()
+    text_html = _HTML_TAG_RE.sub("", report._repr_html_())
     text_plain = report.__repr__()
 
-    text_plain = " ".join(re.findall("[a-zA-Z1-9]+", text_plain))
-    text_html = " ".join(re.findall("[a-zA-Z1-9]+", text_html))
+    text_plain = " ".join(_WORD_RE.findall(text_plain))
+    text_html = " ".join(_WORD_RE.findall(text_html))
 
     # Plain text currently starts with `Date :`;
     # we should remove that, or add it to the html version too.
@@ -146,6 +204,8 @@ def test_extra_meta():
 @pytest.mark.skipif(sys.version_info.major < 3, reason="Tracking not supported on Python 2.")
 def test_tracking():
     scooby.track_imports()
+    import numpy  # noqa
+    import numpy.linalg  # noqa
     from scipy.constants import mu_0  # noqa ; a float value
 
     report = scooby.TrackedReport()
@@ -161,6 +221,30 @@ def test_tracking():
     assert "mu_0" not in report.packages
 
 
+def test_tracking_records_package_once():
+    # Repeated imports and submodules are tracked once, under the package name
+    scooby.track_imports()
+    try:
+        scooby.tracker.scooby_import('numpy')
+        scooby.tracker.scooby_import('numpy.linalg')
+        scooby.tracker.scooby_import('numpy.linalg')
+        assert list(scooby.tracker.TRACKED_IMPORTS) == ['scooby', 'numpy']
+    finally:
+        scooby.untrack_imports()
+
+
+def test_tracking_honours_late_ignores():
+    # Names added to MODULES_TO_IGNORE while tracking are still skipped
+    scooby.track_imports()
+    scooby.tracker.MODULES_TO_IGNORE.add('numpy')
+    try:
+        scooby.tracker.scooby_import('numpy')
+        assert 'numpy' not in scooby.tracker.TRACKED_IMPORTS
+    finally:
+        scooby.tracker.MODULES_TO_IGNORE.discard('numpy')
+        scooby.untrack_imports()
+
+
 def test_version_compare():
     assert scooby.meets_version('2', '1')
     assert not scooby.meets_version('1', '2')
@@ -196,22 +280,52 @@ def test_import_os_error():
     assert scooby.Report(['pyvips'])
 
 
-@pytest.mark.skipif(not sys.platform.startswith('linux'), reason="Not Linux.")
 def test_import_time():
     # Relevant for packages which provide a CLI:
     # How long does it take to import?
-    cmd = ["time", "-f", "%U", sys.executable, "-c", "import scooby"]
-    # Run it twice, just in case.
-    subprocess.run(cmd)
-    subprocess.run(cmd)
-    # Capture it
-    out = subprocess.run(cmd, capture_output=True)
+    cmd = [sys.executable, "-X", "importtime", "-c", "import scooby"]
+    # Run it once to warm the bytecode and file caches, then capture it.
+    subprocess.run(cmd, capture_output=True)
+    out = subprocess.run(cmd, capture_output=True, text=True)
+
+    # Lines read `import time: self [us] | cumulative | imported package`
+    cumulative = {
+        package.strip(): int(cumul) for _, cumul, package in _IMPORT_TIME_RE.findall(out.stderr)
+    }
 
     # Currently we check t < 0.2 s.
-    assert float(out.stderr.decode("utf-8")[:-1]) < 0.2
+    assert cumulative['scooby'] < 200_000
 
 
-@pytest.mark.script_launch_mode('subprocess')
+def test_lazy_import():
+    # The submodules are only imported once one of their names is used
+    code = (
+        "import sys, scooby; "
+        "print('scooby.report' in sys.modules, 'scooby.tracker' in sys.modules); "
+        "scooby.Report; print('scooby.report' in sys.modules)"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert out.stdout.split() == ['False', 'False', 'True']
+
+    # The submodules themselves are reachable after a plain `import scooby`
+    code = (
+        "import scooby; "
+        "print(type(scooby.knowledge.VERSION_ATTRIBUTES).__name__, scooby.tracker.__name__)"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert out.stdout.split() == ['dict', 'scooby.tracker']
+
+    assert scooby.doo is scooby.Report
+    names = dir(scooby)
+    for name in ['TrackedReport', 'knowledge', 'report', 'tracker']:
+        assert name in names
+    for name in ['import_module', 'Any', 'List', 'TYPE_CHECKING']:
+        assert name not in names
+    with pytest.raises(AttributeError, match="no attribute 'foo'"):
+        scooby.foo
+
+
+@pytest.mark.script_launch_mode('inprocess')
 def test_cli(script_runner):
     # help
     for inp in ['--help', '-h']:
@@ -223,12 +337,7 @@ def test_cli(script_runner):
         # Exclude time to avoid errors.
         # Exclude scooby-version, because if run locally without having scooby
         # installed it will be "unknown" for the __main__ one.
-        out = inp.split('OS :')[1]
-        if 'scooby' in inp:
-            out = out.split('scooby :')[0]
-        else:  # As the endings are different.
-            out = out.split('--------')[0]
-        return out
+        return _REPORT_BODY_RE.search(inp).group(1)
 
     # default: scooby-Report
     ret = script_runner.run(['scooby'])
@@ -243,16 +352,6 @@ def test_cli(script_runner):
     print(rep_comp(ret.stdout))
     assert rep_comp(test) == rep_comp(ret.stdout)
 
-    # version -- VIA scooby/__main__.py by calling the folder scooby.
-    ret = script_runner.run([sys.executable, 'scooby', '--version'])
-    assert ret.success
-    assert "scooby v" in ret.stdout
-
-    # version -- VIA scooby/__main__.py by calling the file.
-    ret = script_runner.run([sys.executable, os.path.join('scooby', '__main__.py'), '--version'])
-    assert ret.success
-    assert "scooby v" in ret.stdout
-
     # default: scooby-Report for matplotlibe
     ret = script_runner.run(['scooby', '--report', 'pytest'])
     assert ret.success
@@ -270,7 +369,48 @@ def test_cli(script_runner):
     assert "no Report" in ret.stderr
 
 
+@pytest.mark.script_launch_mode('subprocess')
+def test_cli_main(script_runner):
+    # version -- VIA scooby/__main__.py by calling the folder scooby.
+    ret = script_runner.run([sys.executable, 'scooby', '--version'])
+    assert ret.success
+    assert "scooby v" in ret.stdout
+
+    # version -- VIA scooby/__main__.py by calling the file.
+    ret = script_runner.run([sys.executable, os.path.join('scooby', '__main__.py'), '--version'])
+    assert ret.success
+    assert "scooby v" in ret.stdout
+
+
 def test_auto_report():
     report = scooby.AutoReport('pytest')
     assert 'pytest' in report.packages
     assert 'iniconfig' in report.packages
+
+
+@pytest.mark.parametrize(
+    'requires, expected',
+    [
+        (None, []),
+        (['a>=1.0', 'b (==2)', "c; python_version < '3.10'"], ['a', 'b', 'c']),
+        (['d[extra]>=1', "d; extra == 'test'", 'e @ git+https://example.com/e'], ['d', 'e']),
+    ],
+)
+def test_get_distribution_dependencies(monkeypatch, requires, expected):
+    import importlib.metadata
+
+    dist = SimpleNamespace(requires=requires)
+    monkeypatch.setattr(importlib.metadata, 'distribution', lambda dist_name: dist)
+    assert scooby.report.get_distribution_dependencies('fake_dist') == expected
+
+
+def test_mkl_info(monkeypatch):
+    # numexpr is only consulted if mkl is not available
+    numexpr = SimpleNamespace(get_vml_version=lambda: 'VML 2')
+    monkeypatch.setitem(sys.modules, 'numexpr', numexpr)
+    monkeypatch.setitem(sys.modules, 'mkl', SimpleNamespace(get_version_string=lambda: 'MKL 1'))
+    assert scooby.Report(optional=[]).mkl_info == 'MKL 1'
+    monkeypatch.setitem(sys.modules, 'mkl', None)
+    assert scooby.Report(optional=[]).mkl_info == 'VML 2'
+    monkeypatch.setitem(sys.modules, 'numexpr', None)
+    assert scooby.Report(optional=[]).mkl_info is None